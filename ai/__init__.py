@@ -0,0 +1,3 @@
+"""
+AI package: embeddings and feedback clustering
+"""
@@ -4,20 +4,27 @@ Handles text preprocessing, embeddings, and clustering
 """
 
 import numpy as np
-from sklearn.cluster import KMeans
-from sentence_transformers import SentenceTransformer
-import sys
+import multiprocessing
+import hashlib
+import re
+import threading
 import os
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from database.db import get_user_feedback, clear_user_features, create_feature
+from database.db import (
+    get_user_feedback,
+    replace_user_features,
+    get_cached_embeddings,
+    save_cached_embeddings
+)
 import config
 
 # ============================================
 # TEXT PREPROCESSING
 # ============================================
 
+# Matches runs of whitespace (compiled once at import)
+_WS_RE = re.compile(r'\s+')
+
 def preprocess_text(text):
     """
     Clean and preprocess text for embedding generation
@@ -31,72 +38,265 @@ def preprocess_text(text):
     if not text:
         return ""
     
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove extra whitespace
-    text = ' '.join(text.split())
-    
-    return text.strip()
+    # Lowercase and collapse whitespace in a single regex pass
+    return _WS_RE.sub(' ', text.lower()).strip()
 
 # ============================================
 # EMBEDDING GENERATION
 # ============================================
 
-# Global model instance (loaded once)
+# Global model instance (loaded once per process, shared by all sessions)
 _model = None
+_model_lock = threading.Lock()
+
+def _create_model():
+    """
+    Instantiate the embedding model for the configured backend
+    
+    Returns:
+        SentenceTransformer or OnnxSentenceEncoder: Loaded model
+    """
+    if config.EMBEDDING_BACKEND == 'onnx':
+        from ai.onnx_encoder import OnnxSentenceEncoder
+        
+        print(f"Loading ONNX model: {config.ONNX_MODEL_DIR}")
+        model = OnnxSentenceEncoder(config.ONNX_MODEL_DIR, config.ONNX_MODEL_FILE)
+        print("Model loaded successfully")
+        return model
+    
+    # Heavy imports are deferred so pages that never cluster don't pay them
+    import torch
+    from sentence_transformers import SentenceTransformer
+    
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    print(f"Loading model: {config.MODEL_NAME} ({device})")
+    model = SentenceTransformer(config.MODEL_NAME, device=device)
+    
+    # FP16 halves memory bandwidth on GPU
+    if device == 'cuda':
+        model.half()
+    
+    print("Model loaded successfully")
+    return model
 
 def load_model():
     """
     Load SentenceTransformer model
     Uses lazy loading - only loads when first needed
+    Runs on the GPU in half precision when CUDA is available, or through
+    ONNX Runtime when config.EMBEDDING_BACKEND is "onnx"
+    
+    The instance lives at module level, so it survives Streamlit reruns and
+    is shared by every session; the lock ensures concurrent sessions that
+    cluster at the same time load it only once
     
     Returns:
-        SentenceTransformer: Loaded model
+        SentenceTransformer or OnnxSentenceEncoder: Loaded model
     """
     global _model
     
     if _model is None:
-        print(f"Loading model: {config.MODEL_NAME}")
-        _model = SentenceTransformer(config.MODEL_NAME)
-        print("Model loaded successfully")
+        with _model_lock:
+            if _model is None:
+                _model = _create_model()
     
     return _model
 
-def generate_embeddings(texts):
+def encode_texts(cleaned_texts):
+    """
+    Encode preprocessed texts with the SentenceTransformer model
+    
+    Args:
+        cleaned_texts (list): List of preprocessed text strings
+        
+    Returns:
+        torch.Tensor: L2-normalized embeddings kept on the model's device
+                      (shape: [n_texts, embedding_dim])
+    """
+    # Load model
+    model = load_model()
+    
+    # Generate embeddings (encode() batches length-sorted inputs and
+    # restores the original order). Unit-length vectors make KMeans'
+    # Euclidean distance equivalent to cosine distance
+    return model.encode(
+        cleaned_texts,
+        batch_size=_batch_size(model),
+        show_progress_bar=False,
+        convert_to_tensor=True,
+        normalize_embeddings=True
+    )
+
+def _batch_size(model):
+    """
+    Get the encoding batch size for the model's device
+    
+    Args:
+        model: Loaded embedding model
+        
+    Returns:
+        int: EMBEDDING_BATCH_SIZE on GPU, EMBEDDING_BATCH_SIZE_CPU otherwise
+    """
+    if getattr(getattr(model, 'device', None), 'type', 'cpu') == 'cuda':
+        return config.EMBEDDING_BATCH_SIZE
+    return config.EMBEDDING_BATCH_SIZE_CPU
+
+def text_hash(cleaned_text):
+    """
+    Compute the embedding cache key for a preprocessed text
+    The model name, embedding backend and ONNX model file are part of the
+    key, so switching any of them (e.g. to an int8 ONNX export) never
+    reuses vectors produced by another model
+    
+    Args:
+        cleaned_text (str): Preprocessed text
+        
+    Returns:
+        bytes: SHA-256 digest
+    """
+    key = f"{config.MODEL_NAME}\0{config.EMBEDDING_BACKEND}\0{config.ONNX_MODEL_FILE}\0{cleaned_text}"
+    return hashlib.sha256(key.encode('utf-8')).digest()
+
+def generate_embeddings(texts, use_cache=False):
     """
     Generate embeddings for a list of texts
     
+    Duplicate texts (after preprocessing) are encoded only once. With
+    use_cache, embeddings are stored in the database keyed by a hash of
+    the preprocessed text, so only texts never seen before are re-encoded
+    
     Args:
         texts (list): List of text strings
+        use_cache (bool): Read and write the persistent embedding cache
         
     Returns:
-        np.ndarray: Array of embeddings (shape: [n_texts, embedding_dim])
+        torch.Tensor or np.ndarray: Array of embeddings
+                                    (shape: [n_texts, embedding_dim]).
+                                    Cached lookups return np.ndarray
     """
     if not texts:
         return np.array([])
     
-    # Load model
-    model = load_model()
-    
     # Preprocess texts
-    cleaned_texts = [preprocess_text(text) for text in texts]
+    cleaned_texts = list(map(preprocess_text, texts))
+    
+    # Encode each distinct text once; inverse maps every input back to
+    # its unique row (duplicate tickets and copy-pasted feedback are common)
+    unique_texts, inverse = np.unique(cleaned_texts, return_inverse=True)
+    unique_texts = unique_texts.tolist()
+    
+    if not use_cache:
+        return encode_texts(unique_texts)[inverse]
+    
+    # Look up cached embeddings
+    hashes = [text_hash(text) for text in unique_texts]
+    cached = get_cached_embeddings(hashes)
+    
+    # Encode only texts that aren't cached yet
+    missing = [i for i, h in enumerate(hashes) if h not in cached]
+    if missing:
+        new_embeddings = to_numpy(encode_texts([unique_texts[i] for i in missing]))
+        new_embeddings = new_embeddings.astype(np.float32, copy=False)
+        
+        rows = []
+        for i, embedding in zip(missing, new_embeddings):
+            blob = embedding.tobytes()
+            cached[hashes[i]] = blob
+            rows.append((hashes[i], blob))
+        
+        save_cached_embeddings(rows)
+    
+    # Stack unique vectors, then expand back to input order
+    embeddings = np.vstack([np.frombuffer(cached[h], dtype=np.float32) for h in hashes])
     
-    # Generate embeddings
-    embeddings = model.encode(cleaned_texts, show_progress_bar=False)
+    # Re-normalize in place in case older cache entries were stored unnormalized
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
     
-    return embeddings
+    return embeddings[inverse]
 
 # ============================================
 # CLUSTERING
 # ============================================
 
+def to_numpy(embeddings):
+    """
+    Convert embeddings to a NumPy array
+    Torch tensors are copied to host memory once, at the clustering boundary
+    
+    Args:
+        embeddings (torch.Tensor or np.ndarray): Array of embeddings
+        
+    Returns:
+        np.ndarray: Array of embeddings
+    """
+    if hasattr(embeddings, 'cpu'):
+        return embeddings.detach().cpu().numpy()
+    return np.asarray(embeddings)
+
+def _kmeans_faiss(embeddings, n_clusters):
+    """
+    Run KMeans using faiss, on the GPU when the faiss build has one
+    
+    Args:
+        embeddings (torch.Tensor or np.ndarray): Array of embeddings
+        n_clusters (int): Number of clusters
+        
+    Returns:
+        np.ndarray: Array of cluster labels
+    """
+    import faiss
+    
+    data = np.ascontiguousarray(to_numpy(embeddings), dtype='float32')
+    
+    # CPU-only faiss builds can't take gpu=True
+    use_gpu = hasattr(faiss, 'get_num_gpus') and faiss.get_num_gpus() > 0
+    
+    kmeans = faiss.Kmeans(d=data.shape[1], k=n_clusters, niter=20, gpu=use_gpu, seed=42)
+    kmeans.train(data)
+    
+    # Assign each point to its nearest centroid
+    _, labels = kmeans.index.search(data, 1)
+    
+    return labels.ravel()
+
+def _kmeans_cuml(embeddings, n_clusters):
+    """
+    Run KMeans on the GPU using RAPIDS cuML
+    
+    Args:
+        embeddings (torch.Tensor or np.ndarray): Array of embeddings
+        n_clusters (int): Number of clusters
+        
+    Returns:
+        np.ndarray: Array of cluster labels
+    """
+    import cupy as cp
+    from cuml.cluster import KMeans as cuKMeans
+    
+    # CUDA tensors are shared with cupy without a host round-trip
+    if getattr(embeddings, 'is_cuda', False):
+        data = cp.asarray(embeddings.detach()).astype(cp.float32, copy=False)
+    else:
+        data = cp.asarray(to_numpy(embeddings), dtype=cp.float32)
+    kmeans = cuKMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+    labels = kmeans.fit_predict(data)
+    
+    return cp.asnumpy(labels)
+
+# GPU KMeans implementations selectable via config.KMEANS_BACKEND
+_GPU_BACKENDS = {
+    'faiss': _kmeans_faiss,
+    'cuml': _kmeans_cuml
+}
+
 def cluster_feedback(embeddings, n_clusters=None):
     """
     Cluster embeddings using KMeans
+    Uses the GPU backend from config.KMEANS_BACKEND when available,
+    otherwise falls back to scikit-learn
     
     Args:
-        embeddings (np.ndarray): Array of embeddings
+        embeddings (torch.Tensor or np.ndarray): Array of embeddings
         n_clusters (int, optional): Number of clusters. 
                                     If None, uses DEFAULT_CLUSTER_COUNT from config
         
@@ -110,9 +310,42 @@ def cluster_feedback(embeddings, n_clusters=None):
     n_samples = len(embeddings)
     n_clusters = min(n_clusters, n_samples)
     
-    # Run KMeans
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-    labels = kmeans.fit_predict(embeddings)
+    # Try GPU backend first if configured
+    gpu_kmeans = _GPU_BACKENDS.get(config.KMEANS_BACKEND)
+    if gpu_kmeans is not None:
+        try:
+            return gpu_kmeans(embeddings, n_clusters)
+        except ImportError:
+            print(f"{config.KMEANS_BACKEND} not available, falling back to scikit-learn")
+        except Exception as e:
+            # e.g. no usable GPU/driver at runtime
+            print(f"{config.KMEANS_BACKEND} failed ({str(e)}), falling back to scikit-learn")
+    
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+    
+    if n_samples > config.MINIBATCH_KMEANS_THRESHOLD:
+        # Mini-batch updates keep large feedback sets cheap
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            random_state=42,
+            n_init=3,
+            batch_size=1024,
+            max_iter=100,
+            reassignment_ratio=0.01
+        )
+    else:
+        # k-means++ seeding needs few restarts; one is enough for small datasets.
+        # Elkan's algorithm prunes distance computations with the triangle
+        # inequality, which pays off on normalized high-dimensional embeddings
+        n_init = 1 if n_samples < 200 else 3
+        kmeans = KMeans(
+            n_clusters=n_clusters,
+            random_state=42,
+            n_init=n_init,
+            algorithm='elkan'
+        )
+    
+    labels = kmeans.fit_predict(to_numpy(embeddings))
     
     return labels
 
@@ -120,26 +353,28 @@ def cluster_feedback(embeddings, n_clusters=None):
 # FEATURE NAME GENERATION
 # ============================================
 
-def get_representative_text(feedback_texts, cluster_indices):
+def get_representative_text(feedback_texts, cluster_indices, lengths=None):
     """
     Get the most representative text for a cluster
     Uses the shortest text as it's often the most concise
     
     Args:
         feedback_texts (list): List of all feedback texts
-        cluster_indices (list): Indices of feedback in this cluster
+        cluster_indices (list or np.ndarray): Indices of feedback in this cluster
+        lengths (np.ndarray, optional): Precomputed lengths of all feedback texts
         
     Returns:
         str: Representative text for the cluster
     """
-    if not cluster_indices:
+    if len(cluster_indices) == 0:
         return "Unnamed Feature"
     
-    # Get texts for this cluster
-    cluster_texts = [feedback_texts[i] for i in cluster_indices]
+    if lengths is None:
+        lengths = np.fromiter((len(t) for t in feedback_texts), dtype=np.int32, count=len(feedback_texts))
     
     # Find shortest text (usually most concise)
-    representative = min(cluster_texts, key=len)
+    cluster_indices = np.asarray(cluster_indices)
+    representative = feedback_texts[cluster_indices[np.argmin(lengths[cluster_indices])]]
     
     # Truncate if too long
     max_length = 100
@@ -153,7 +388,7 @@ def generate_features_from_clusters(feedback_list, labels):
     Generate feature names and calculate reach for each cluster
     
     Args:
-        feedback_list (list): List of feedback dictionaries
+        feedback_list (list): List of feedback rows with a 'feedback_text' column
         labels (np.ndarray): Array of cluster labels
         
     Returns:
@@ -161,21 +396,31 @@ def generate_features_from_clusters(feedback_list, labels):
     """
     features = []
     
-    # Get unique cluster labels
-    unique_labels = np.unique(labels)
+    labels = np.asarray(labels)
+    if labels.size == 0:
+        return features
+    
+    # Cluster sizes (reach) in one pass over the labels
+    unique_labels, counts = np.unique(labels, return_counts=True)
     
-    # Extract feedback texts
+    # Group feedback indices by cluster with a single stable sort;
+    # cluster i occupies order[boundaries[i]:boundaries[i + 1]]
+    order = np.argsort(labels, kind='stable')
+    boundaries = np.concatenate(([0], np.cumsum(counts)))
+    
+    # Extract feedback texts and their lengths
     feedback_texts = [f['feedback_text'] for f in feedback_list]
+    lengths = np.fromiter((len(t) for t in feedback_texts), dtype=np.int32, count=len(feedback_texts))
     
-    for cluster_id in unique_labels:
+    for i, cluster_id in enumerate(unique_labels):
         # Get indices of feedback in this cluster
-        cluster_indices = np.where(labels == cluster_id)[0].tolist()
+        cluster_indices = order[boundaries[i]:boundaries[i + 1]]
         
         # Get representative text for feature name
-        feature_name = get_representative_text(feedback_texts, cluster_indices)
+        feature_name = get_representative_text(feedback_texts, cluster_indices, lengths)
         
-        # Calculate reach (number of feedback items)
-        reach = len(cluster_indices)
+        # Reach is the number of feedback items in the cluster
+        reach = int(counts[i])
         
         features.append({
             'feature_name': feature_name,
@@ -226,9 +471,9 @@ def run_clustering(user_id):
         # Step 3: Extract feedback texts
         feedback_texts = [f['feedback_text'] for f in feedback_list]
         
-        # Step 4: Generate embeddings
+        # Step 4: Generate embeddings (reusing cached ones)
         print(f"Generating embeddings for {len(feedback_texts)} feedback items...")
-        embeddings = generate_embeddings(feedback_texts)
+        embeddings = generate_embeddings(feedback_texts, use_cache=True)
         
         if len(embeddings) == 0:
             return False, "Failed to generate embeddings", 0
@@ -240,25 +485,49 @@ def run_clustering(user_id):
         # Step 6: Generate features from clusters
         features = generate_features_from_clusters(feedback_list, labels)
         
-        # Step 7: Clear old features
-        clear_user_features(user_id)
-        
-        # Step 8: Save new features to database
-        feature_count = 0
-        for feature in features:
-            success, message, feature_id = create_feature(
-                user_id,
-                feature['feature_name'],
-                feature['reach']
-            )
-            if success:
-                feature_count += 1
+        # Step 7: Replace old features with the new ones in one transaction
+        success, message, feature_count = replace_user_features(user_id, features)
+        if not success:
+            return False, message, 0
         
         return True, f"Successfully created {feature_count} feature clusters", feature_count
         
     except Exception as e:
         return False, f"Error during clustering: {str(e)}", 0
 
+def _init_clustering_worker():
+    """
+    Load the model and limit the worker to a single OpenMP/BLAS thread
+    Pays the model load once per worker, and keeps parallel KMeans runs
+    from oversubscribing cores
+    """
+    load_model()
+    
+    # After load_model, so torch's OpenMP runtime is loaded and gets capped too
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(limits=1)
+
+def run_clustering_batch(user_ids):
+    """
+    Run the clustering pipeline for several users in parallel
+    Workers are spawned rather than forked: the parent may already have
+    initialized CUDA, which a forked child can't use
+    
+    Args:
+        user_ids (list): List of user IDs
+        
+    Returns:
+        list: One (success, message, feature_count) tuple per user, in input order
+    """
+    if not user_ids:
+        return []
+    
+    processes = min(len(user_ids), os.cpu_count() or 1)
+    context = multiprocessing.get_context("spawn")
+    
+    with context.Pool(processes=processes, initializer=_init_clustering_worker) as pool:
+        return pool.map(run_clustering, user_ids)
+
 # ============================================
 # CLUSTERING STATISTICS
 # ============================================
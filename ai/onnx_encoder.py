@@ -0,0 +1,95 @@
+"""
+ONNX Runtime encoder module
+Runs an ONNX-exported SentenceTransformer on CPU with a compatible encode()
+"""
+
+import os
+import numpy as np
+
+class OnnxSentenceEncoder:
+    """
+    Minimal SentenceTransformer-compatible encoder backed by ONNX Runtime
+    
+    The model directory is expected to hold the exported ONNX graph and the
+    HuggingFace tokenizer files, e.g. as produced by:
+        optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 \\
+            --optimize O3 --task feature-extraction <model_dir>
+    """
+    
+    def __init__(self, model_dir, model_file="model.onnx", max_length=256):
+        """
+        Load the tokenizer and create the inference session
+        
+        Args:
+            model_dir (str): Directory with the ONNX model and tokenizer files
+            model_file (str): ONNX file name (e.g. an int8-quantized variant)
+            max_length (int): Maximum number of tokens per text
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_length = max_length
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, model_file),
+            options,
+            providers=['CPUExecutionProvider']
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+    
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, **kwargs):
+        """
+        Encode texts into mean-pooled sentence embeddings
+        
+        Args:
+            texts (list): List of text strings
+            batch_size (int): Number of texts per inference call
+            normalize_embeddings (bool): L2-normalize the output vectors
+            **kwargs: Ignored SentenceTransformer options (e.g. show_progress_bar)
+            
+        Returns:
+            np.ndarray: Array of embeddings (shape: [n_texts, embedding_dim])
+        """
+        if not texts:
+            return np.array([])
+        
+        # Sort by length so each batch pads to a similar size
+        order = np.argsort([len(t) for t in texts], kind='stable')
+        
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            batch = [texts[i] for i in order[start:start + batch_size]]
+            
+            encoded = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors='np'
+            )
+            inputs = {
+                name: value.astype(np.int64)
+                for name, value in encoded.items()
+                if name in self.input_names
+            }
+            
+            token_embeddings = self.session.run(None, inputs)[0]
+            
+            # Mean pooling over non-padding tokens
+            mask = encoded['attention_mask'][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            batches.append(summed / np.clip(mask.sum(axis=1), 1e-9, None))
+        
+        # Restore the original input order
+        sorted_embeddings = np.vstack(batches)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        
+        if normalize_embeddings:
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
+        
+        return embeddings
@@ -4,7 +4,9 @@ Main Streamlit Application Entry Point
 """
 
 import streamlit as st
-from database.db import initialize_database, get_feedback_count, get_feature_count, get_user_features
+import pandas as pd
+from collections import Counter
+from database.db import initialize_database, get_dashboard_summary, get_user_features
 from auth.auth import (
     initialize_session_state,
     is_logged_in,
@@ -18,19 +20,18 @@ from feedback.feedback_processor import (
     process_csv,
     get_all_feedback,
     get_feedback_stats,
-    delete_feedback_item
+    delete_feedback_items
 )
 from ai.clustering import (
     run_clustering,
     get_clustering_stats
 )
 from scoring.rice_scoring import (
-    score_feature,
+    score_features_bulk,
     get_unscored_features,
     get_all_scored_features,
     get_top_features,
     get_scoring_stats,
-    get_priority_level,
     get_priority_color
 )
 from utils.helpers import format_timestamp
@@ -50,6 +51,47 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ============================================
+# CACHED STATISTICS
+# ============================================
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_dashboard_stats(user_id):
+    """
+    Get all dashboard aggregates for a user in one cached call
+    
+    Args:
+        user_id (int): User's ID
+        
+    Returns:
+        dict: Feedback count, feature count, scored count and top features
+    """
+    stats = get_dashboard_summary(user_id)
+    stats['top_features'] = get_top_features(user_id, 5)
+    return stats
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_clustering_stats(user_id):
+    """
+    Cached wrapper around get_clustering_stats
+    """
+    return get_clustering_stats(user_id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_scoring_stats(user_id):
+    """
+    Cached wrapper around get_scoring_stats
+    """
+    return get_scoring_stats(user_id)
+
+def clear_stats_cache():
+    """
+    Invalidate cached statistics after feedback, features or scores change
+    """
+    _cached_dashboard_stats.clear()
+    _cached_clustering_stats.clear()
+    _cached_scoring_stats.clear()
+
 # ============================================
 # AUTHENTICATION PAGES
 # ============================================
@@ -127,6 +169,25 @@ def show_auth_page():
 # MAIN DASHBOARD (LOGGED IN USERS)
 # ============================================
 
+# Sidebar navigation entries: (page key, button label)
+NAV_PAGES = (
+    ('dashboard', "📊 Dashboard"),
+    ('feedback', "📝 Feedback Collection"),
+    ('clustering', "🤖 AI Clustering"),
+    ('scoring', "⭐ Score Features"),
+)
+
+def navigate_to(page):
+    """
+    Switch the current page
+    Used as a button on_click callback: callbacks run before the rerun
+    triggered by the click, so no second st.rerun() is needed
+    
+    Args:
+        page (str): Page key ('dashboard', 'feedback', 'clustering', 'scoring')
+    """
+    st.session_state.current_page = page
+
 def show_dashboard():
     """
     Display main dashboard for authenticated users
@@ -148,42 +209,25 @@ def show_dashboard():
         if 'current_page' not in st.session_state:
             st.session_state.current_page = 'dashboard'
         
-        if st.button("📊 Dashboard", use_container_width=True, 
-                     type="primary" if st.session_state.current_page == 'dashboard' else "secondary"):
-            st.session_state.current_page = 'dashboard'
-            st.rerun()
+        current_page = st.session_state.current_page
         
-        if st.button("📝 Feedback Collection", use_container_width=True,
-                     type="primary" if st.session_state.current_page == 'feedback' else "secondary"):
-            st.session_state.current_page = 'feedback'
-            st.rerun()
-        
-        if st.button("🤖 AI Clustering", use_container_width=True,
-                     type="primary" if st.session_state.current_page == 'clustering' else "secondary"):
-            st.session_state.current_page = 'clustering'
-            st.rerun()
-        
-        if st.button("⭐ Score Features", use_container_width=True,
-                     type="primary" if st.session_state.current_page == 'scoring' else "secondary"):
-            st.session_state.current_page = 'scoring'
-            st.rerun()
+        for page, label in NAV_PAGES:
+            st.button(label, use_container_width=True,
+                      type="primary" if page == current_page else "secondary",
+                      on_click=navigate_to, args=(page,))
         
         st.markdown("---")
         
         # Logout button
-        if st.button("🚪 Logout", use_container_width=True):
-            logout_user()
-            st.rerun()
+        st.button("🚪 Logout", use_container_width=True, on_click=logout_user)
     
     # Route to appropriate page
-    if st.session_state.current_page == 'feedback':
-        show_feedback_page(user)
-    elif st.session_state.current_page == 'clustering':
-        show_clustering_page(user)
-    elif st.session_state.current_page == 'scoring':
-        show_scoring_page(user)
-    else:
-        show_dashboard_home(user)
+    page_handlers = {
+        'feedback': show_feedback_page,
+        'clustering': show_clustering_page,
+        'scoring': show_scoring_page,
+    }
+    page_handlers.get(current_page, show_dashboard_home)(user)
 
 def show_dashboard_home(user):
     """
@@ -196,10 +240,10 @@ def show_dashboard_home(user):
     st.success(f"Welcome, {user['name']}! 👋")
     
     # Get statistics
-    feedback_count = get_feedback_count(user['id'])
-    feature_count = get_feature_count(user['id'])
-    scoring_stats = get_scoring_stats(user['id'])
-    scored_count = scoring_stats['scored_count']
+    dashboard_stats = _cached_dashboard_stats(user['id'])
+    feedback_count = dashboard_stats['feedback_count']
+    feature_count = dashboard_stats['feature_count']
+    scored_count = dashboard_stats['scored_count']
     
     # Metrics
     col1, col2, col3 = st.columns(3)
@@ -221,16 +265,14 @@ def show_dashboard_home(user):
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.button("📝 Add Feedback", use_container_width=True, type="primary"):
-            st.session_state.current_page = 'feedback'
-            st.rerun()
+        st.button("📝 Add Feedback", use_container_width=True, type="primary",
+                  on_click=navigate_to, args=('feedback',))
     
     with col2:
         # Enable clustering button if enough feedback
         can_cluster = feedback_count >= config.MIN_FEEDBACK_FOR_CLUSTERING
-        if st.button("🤖 Run AI Clustering", use_container_width=True, disabled=not can_cluster):
-            st.session_state.current_page = 'clustering'
-            st.rerun()
+        st.button("🤖 Run AI Clustering", use_container_width=True, disabled=not can_cluster,
+                  on_click=navigate_to, args=('clustering',))
     
     st.markdown("---")
     
@@ -251,10 +293,10 @@ def show_dashboard_home(user):
             st.markdown("---")
             st.subheader("🎯 Top 5 Recommended Features")
             
-            top_features = get_top_features(user['id'], 5)
+            top_features = dashboard_stats['top_features']
             
             for idx, feature in enumerate(top_features[:5], 1):
-                priority = get_priority_level(feature['rice_score'])
+                priority = feature['priority_level']
                 
                 col1, col2, col3 = st.columns([5, 1.5, 1])
                 
@@ -302,6 +344,7 @@ def show_feedback_page(user):
                     success, message = submit_feedback(user['id'], feedback_text)
                     
                     if success:
+                        clear_stats_cache()
                         st.success(message)
                         st.rerun()
                     else:
@@ -336,6 +379,7 @@ def show_feedback_page(user):
                     success, message, count = process_csv(user['id'], uploaded_file)
                     
                     if success:
+                        clear_stats_cache()
                         st.success(f"✅ {message}")
                         st.balloons()
                         st.rerun()
@@ -353,29 +397,41 @@ def show_feedback_page(user):
     if feedback_list:
         st.write(f"**Total: {len(feedback_list)} feedback items**")
         
-        # Display feedback in a nice format
-        for idx, feedback in enumerate(feedback_list, 1):
-            with st.container():
-                col1, col2, col3 = st.columns([6, 1, 0.5])
-                
-                with col1:
-                    st.write(f"**{idx}.** {feedback['feedback_text']}")
-                
-                with col2:
-                    st.caption(format_timestamp(feedback['created_at']))
-                
-                with col3:
-                    # Delete button for each feedback
-                    delete_key = f"delete_{feedback['id']}"
-                    if st.button("🗑️", key=delete_key, help="Delete this feedback"):
-                        success, message = delete_feedback_item(feedback['id'], user['id'])
-                        if success:
-                            st.success(message)
-                            st.rerun()
-                        else:
-                            st.error(message)
+        # Display all feedback in a single table with a delete checkbox column
+        feedback_df = pd.DataFrame(feedback_list, columns=feedback_list[0].keys())
+        feedback_df['created_at'] = pd.to_datetime(feedback_df['created_at'])
+        feedback_df.insert(0, 'delete', False)
+        
+        with st.form("feedback_list_form"):
+            edited_df = st.data_editor(
+                feedback_df,
+                column_config={
+                    "delete": st.column_config.CheckboxColumn("🗑️", help="Select feedback to delete"),
+                    "id": None,
+                    "feedback_text": st.column_config.TextColumn("Feedback", width="large"),
+                    "created_at": st.column_config.DatetimeColumn("Created", format="YYYY-MM-DD HH:mm")
+                },
+                disabled=["feedback_text", "created_at"],
+                hide_index=True,
+                use_container_width=True
+            )
+            
+            delete_submitted = st.form_submit_button("🗑️ Delete Selected")
+            
+            if delete_submitted:
+                selected_ids = edited_df.loc[edited_df['delete'], 'id'].tolist()
                 
-                st.markdown("---")
+                if not selected_ids:
+                    st.warning("Select at least one feedback item to delete")
+                else:
+                    success, message, deleted_count = delete_feedback_items(selected_ids, user['id'])
+                    
+                    if success:
+                        clear_stats_cache()
+                        st.success(message)
+                        st.rerun()
+                    else:
+                        st.error(message)
     else:
         st.info("No feedback yet. Add your first feedback above!")
     
@@ -394,7 +450,7 @@ def show_clustering_page(user):
     st.markdown("---")
     
     # Get clustering statistics
-    stats = get_clustering_stats(user['id'])
+    stats = _cached_clustering_stats(user['id'])
     
     # Info box
     st.info("""
@@ -429,9 +485,8 @@ def show_clustering_page(user):
         st.warning(f"⚠️ **Not Ready**: You need at least {stats['min_required']} feedback items to run clustering.")
         st.write(f"Current: {stats['feedback_count']} feedback items")
         
-        if st.button("Go to Feedback Collection", type="primary"):
-            st.session_state.current_page = 'feedback'
-            st.rerun()
+        st.button("Go to Feedback Collection", type="primary",
+                  on_click=navigate_to, args=('feedback',))
     else:
         st.write(f"✅ Ready to cluster {stats['feedback_count']} feedback items into ~{config.DEFAULT_CLUSTER_COUNT} feature groups")
         
@@ -448,6 +503,7 @@ def show_clustering_page(user):
                 success, message, feature_count = run_clustering(user['id'])
                 
                 if success:
+                    clear_stats_cache()
                     st.success(f"✅ {message}")
                     st.balloons()
                     st.rerun()
@@ -496,7 +552,7 @@ def show_scoring_page(user):
     st.markdown("---")
     
     # Get statistics
-    stats = get_scoring_stats(user['id'])
+    stats = _cached_scoring_stats(user['id'])
     
     # Info box
     st.info("""
@@ -529,9 +585,8 @@ def show_scoring_page(user):
     if stats['total_features'] == 0:
         st.warning("⚠️ **No Features Found**: Run AI clustering first to identify features.")
         
-        if st.button("Go to AI Clustering", type="primary"):
-            st.session_state.current_page = 'clustering'
-            st.rerun()
+        st.button("Go to AI Clustering", type="primary",
+                  on_click=navigate_to, args=('clustering',))
     else:
         # Tabs for scoring and priority dashboard
         tab1, tab2 = st.tabs(["📝 Score Features", "🎯 Priority Dashboard"])
@@ -549,53 +604,55 @@ def show_scoring_page(user):
                 st.write(f"**{len(unscored_features)} features need scoring:**")
                 st.markdown("---")
                 
-                # Score each feature
-                for feature in unscored_features:
-                    with st.container():
-                        st.write(f"### {feature['feature_name']}")
-                        st.caption(f"Reach: {feature['reach']} feedback items")
-                        
-                        # Create form for this feature
-                        with st.form(f"score_form_{feature['id']}"):
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                impact = st.select_slider(
-                                    "Impact (1-5)",
-                                    options=[1, 2, 3, 4, 5],
-                                    value=3,
-                                    help="How much will this improve the product? 1=Minimal, 5=Massive",
-                                    key=f"impact_{feature['id']}"
-                                )
-                            
-                            with col2:
-                                effort = st.select_slider(
-                                    "Effort (1-5)",
-                                    options=[1, 2, 3, 4, 5],
-                                    value=3,
-                                    help="How much work is required? 1=Easy, 5=Very Hard",
-                                    key=f"effort_{feature['id']}"
-                                )
-                            
-                            submitted = st.form_submit_button("Calculate RICE Score", use_container_width=True, type="primary")
-                            
-                            if submitted:
-                                success, message, rice_score = score_feature(
-                                    feature['id'],
-                                    user['id'],
-                                    feature['reach'],
-                                    impact,
-                                    effort,
-                                    config.DEFAULT_CONFIDENCE
-                                )
-                                
-                                if success:
-                                    st.success(f"✅ {message}")
-                                    st.rerun()
-                                else:
-                                    st.error(f"❌ {message}")
+                # Score all features in one form
+                scoring_df = pd.DataFrame(unscored_features, columns=unscored_features[0].keys())[['id', 'feature_name', 'reach']]
+                scoring_df['impact'] = 3
+                scoring_df['effort'] = 3
+                
+                with st.form("score_features_form"):
+                    edited_df = st.data_editor(
+                        scoring_df,
+                        column_config={
+                            "id": None,
+                            "feature_name": st.column_config.TextColumn("Feature", width="large"),
+                            "reach": st.column_config.NumberColumn("Reach", help="Number of feedback items"),
+                            "impact": st.column_config.NumberColumn(
+                                "Impact (1-5)",
+                                min_value=1,
+                                max_value=5,
+                                step=1,
+                                required=True,
+                                help="How much will this improve the product? 1=Minimal, 5=Massive"
+                            ),
+                            "effort": st.column_config.NumberColumn(
+                                "Effort (1-5)",
+                                min_value=1,
+                                max_value=5,
+                                step=1,
+                                required=True,
+                                help="How much work is required? 1=Easy, 5=Very Hard"
+                            )
+                        },
+                        disabled=["feature_name", "reach"],
+                        hide_index=True,
+                        use_container_width=True
+                    )
+                    
+                    submitted = st.form_submit_button("Calculate RICE Scores", use_container_width=True, type="primary")
+                    
+                    if submitted:
+                        success, message, count = score_features_bulk(
+                            user['id'],
+                            edited_df.to_dict('records'),
+                            config.DEFAULT_CONFIDENCE
+                        )
                         
-                        st.markdown("---")
+                        if success:
+                            clear_stats_cache()
+                            st.success(f"✅ {message}")
+                            st.rerun()
+                        else:
+                            st.error(f"❌ {message}")
         
         # ===== PRIORITY DASHBOARD TAB =====
         with tab2:
@@ -606,14 +663,16 @@ def show_scoring_page(user):
             if not scored_features:
                 st.info("📊 No scored features yet. Score features in the previous tab to see prioritization.")
             else:
+                # Priority levels are classified by the query; count them in one pass
+                priorities = [f['priority_level'] for f in scored_features]
+                priority_counts = Counter(priorities)
+                
                 # Top 5 recommendations
                 st.success(f"🎯 **Top {min(5, len(scored_features))} Recommended for Next Sprint**")
                 
                 top_5 = scored_features[:5]
                 
-                for idx, feature in enumerate(top_5, 1):
-                    priority = get_priority_level(feature['rice_score'])
-                    
+                for idx, (feature, priority) in enumerate(zip(top_5, priorities), 1):
                     with st.container():
                         col1, col2, col3, col4 = st.columns([4, 1, 1, 1])
                         
@@ -644,40 +703,37 @@ def show_scoring_page(user):
                     st.markdown("---")
                     st.subheader("All Prioritized Features")
                     
-                    for idx, feature in enumerate(scored_features[5:], 6):
-                        priority = get_priority_level(feature['rice_score'])
-                        
-                        with st.container():
-                            col1, col2, col3, col4 = st.columns([4, 1, 1, 1])
-                            
-                            with col1:
-                                st.write(f"**{idx}. {feature['feature_name']}**")
-                            
-                            with col2:
-                                st.metric("RICE", f"{feature['rice_score']:.1f}")
-                            
-                            with col3:
-                                st.metric("Reach", feature['reach'])
-                            
-                            with col4:
-                                if priority == "High":
-                                    st.success(priority)
-                                elif priority == "Medium":
-                                    st.warning(priority)
-                                else:
-                                    st.error(priority)
-                            
-                            st.caption(f"Impact: {feature['impact']} | Confidence: {feature['confidence']}% | Effort: {feature['effort']}")
-                            
-                            st.markdown("---")
+                    # Render the remainder as one table instead of widgets per feature
+                    remaining_df = pd.DataFrame(
+                        scored_features[5:],
+                        columns=['feature_name', 'rice_score', 'reach', 'impact', 'confidence', 'effort']
+                    )
+                    remaining_df.insert(0, 'rank', range(6, len(scored_features) + 1))
+                    remaining_df['priority'] = priorities[5:]
+                    
+                    st.dataframe(
+                        remaining_df,
+                        column_config={
+                            "rank": st.column_config.NumberColumn("#"),
+                            "feature_name": st.column_config.TextColumn("Feature", width="large"),
+                            "rice_score": st.column_config.NumberColumn("RICE", format="%.1f"),
+                            "reach": st.column_config.NumberColumn("Reach"),
+                            "impact": st.column_config.NumberColumn("Impact"),
+                            "confidence": st.column_config.NumberColumn("Confidence", format="%d%%"),
+                            "effort": st.column_config.NumberColumn("Effort"),
+                            "priority": st.column_config.TextColumn("Priority")
+                        },
+                        hide_index=True,
+                        use_container_width=True
+                    )
                 
                 # Summary statistics
                 st.markdown("---")
                 st.subheader("Summary")
                 
-                high_priority = len([f for f in scored_features if get_priority_level(f['rice_score']) == "High"])
-                medium_priority = len([f for f in scored_features if get_priority_level(f['rice_score']) == "Medium"])
-                low_priority = len([f for f in scored_features if get_priority_level(f['rice_score']) == "Low"])
+                high_priority = priority_counts["High"]
+                medium_priority = priority_counts["Medium"]
+                low_priority = priority_counts["Low"]
                 
                 col1, col2, col3 = st.columns(3)
                 
@@ -0,0 +1,3 @@
+"""
+Authentication package: signup, login and session handling
+"""
@@ -5,13 +5,18 @@ Handles user signup, login, logout, and session management
 
 import bcrypt
 import streamlit as st
+import hashlib
+import hmac
 import re
-import sys
-import os
+import secrets
+import time
+from collections import OrderedDict
 
-# Add parent directory to path to import from other modules
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from database.db import create_user, get_user_by_email, get_user_by_id
+import config
+
+# Basic email regex pattern (compiled once at import)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 # ============================================
 # PASSWORD HASHING
@@ -27,14 +32,25 @@ def hash_password(password):
     Returns:
         str: Hashed password
     """
-    # Generate salt and hash password
-    salt = bcrypt.gensalt()
+    # Generate salt with the configured cost and hash password
+    salt = bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
+# In-process LRU of successful verifications, mapping
+# (HMAC-SHA256(password), hash) to an expiry time. The HMAC key is random
+# per process, so neither plaintext passwords nor digests that could be
+# brute-forced offline are kept in memory. Never persisted.
+_PROCESS_SECRET = secrets.token_bytes(32)
+_VERIFIED_CACHE = OrderedDict()
+_VERIFIED_CACHE_SIZE = 128
+
 def verify_password(plain_password, hashed_password):
     """
     Verify a password against its hash
+    Repeated successful checks of the same pair within PASSWORD_CACHE_TTL
+    seconds skip the bcrypt computation; failed attempts always pay the
+    full bcrypt cost
     
     Args:
         plain_password (str): Plain text password to verify
@@ -43,10 +59,28 @@ def verify_password(plain_password, hashed_password):
     Returns:
         bool: True if password matches, False otherwise
     """
-    return bcrypt.checkpw(
+    key = (
+        hmac.new(_PROCESS_SECRET, plain_password.encode('utf-8'), hashlib.sha256).digest(),
+        hashed_password
+    )
+    now = time.monotonic()
+    
+    expires_at = _VERIFIED_CACHE.pop(key, None)
+    if expires_at is not None and expires_at > now:
+        _VERIFIED_CACHE[key] = expires_at
+        return True
+    
+    matches = bcrypt.checkpw(
         plain_password.encode('utf-8'),
         hashed_password.encode('utf-8')
     )
+    
+    if matches:
+        _VERIFIED_CACHE[key] = now + config.PASSWORD_CACHE_TTL
+        if len(_VERIFIED_CACHE) > _VERIFIED_CACHE_SIZE:
+            _VERIFIED_CACHE.popitem(last=False)
+    
+    return matches
 
 # ============================================
 # INPUT VALIDATION
@@ -65,10 +99,7 @@ def validate_email(email):
     if not email:
         return False, "Email is required"
     
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(pattern, email):
+    if not _EMAIL_RE.match(email):
         return False, "Invalid email format"
     
     return True, ""
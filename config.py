@@ -10,18 +10,48 @@ import os
 # ============================================
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), "database", "feature_prioritization.db")
 
+# Idle read-only connections kept open for concurrent readers
+DB_READ_POOL_SIZE = 4
+
+# Rows committed per transaction in bulk imports
+DB_WRITE_CHUNK_SIZE = 1000
+
+# Seconds a caller waits for its write to be committed before giving up
+DB_WRITE_TIMEOUT = 60
+
 # ============================================
 # AI/NLP CONFIGURATION
 # ============================================
 # Sentence Transformer model for generating embeddings
 MODEL_NAME = "all-MiniLM-L6-v2"
 
+# Embedding backend: "torch" (SentenceTransformer) or "onnx" (ONNX Runtime on CPU)
+# "onnx" needs the optional packages in requirements-onnx.txt
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+
+# Exported ONNX model directory and file (use an int8-quantized file for smaller/faster CPU inference)
+ONNX_MODEL_DIR = os.path.join(os.path.dirname(__file__), "models", "all-MiniLM-L6-v2-onnx")
+ONNX_MODEL_FILE = "model.onnx"
+
+# Batch size for embedding generation
+# SentenceTransformer sorts inputs by length internally, so large batches
+# keep padding overhead low on GPU; on CPU, smaller batches stay cache-friendly
+EMBEDDING_BATCH_SIZE = 1024
+EMBEDDING_BATCH_SIZE_CPU = 64
+
 # Default number of clusters for KMeans
 DEFAULT_CLUSTER_COUNT = 5
 
 # Minimum number of feedback items required for clustering
 MIN_FEEDBACK_FOR_CLUSTERING = 3
 
+# Switch to MiniBatchKMeans above this many feedback items
+MINIBATCH_KMEANS_THRESHOLD = 500
+
+# KMeans implementation: "sklearn" (CPU), "faiss" (faiss-gpu) or "cuml" (RAPIDS)
+# Falls back to sklearn if the selected GPU library is not installed
+KMEANS_BACKEND = os.getenv("KMEANS_BACKEND", "sklearn")
+
 # ============================================
 # RICE SCORING CONFIGURATION
 # ============================================
@@ -48,3 +78,13 @@ MAX_FEEDBACK_PER_USER = 2000
 # SESSION CONFIGURATION
 # ============================================
 SESSION_TIMEOUT_HOURS = 24
+
+# ============================================
+# SECURITY CONFIGURATION
+# ============================================
+# bcrypt work factor (each +1 doubles hashing time)
+# Changing it doesn't invalidate existing hashes: bcrypt stores the cost in each hash
+BCRYPT_ROUNDS = 12
+
+# Seconds a successful password check is remembered before bcrypt runs again
+PASSWORD_CACHE_TTL = 300
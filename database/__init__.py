@@ -0,0 +1,3 @@
+"""
+Database package: SQLite connections and queries
+"""
@@ -4,87 +4,352 @@ Handles all database connections and table creation
 """
 
 import sqlite3
+import threading
+import atexit
+import functools
+import queue
 import os
-import sys
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
 
-# Add parent directory to path to import config
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from config import DATABASE_PATH
+from config import (
+    DATABASE_PATH,
+    DB_READ_POOL_SIZE,
+    DB_WRITE_CHUNK_SIZE,
+    DB_WRITE_TIMEOUT,
+    RICE_HIGH_THRESHOLD,
+    RICE_MEDIUM_THRESHOLD
+)
 
 # Database file path from config
 DB_PATH = DATABASE_PATH
 
+# Shared connection, opened once per process and reused across reruns/sessions
+_conn = None
+_conn_pid = None
+
+# Held by the writer thread for the duration of each write transaction
+_write_lock = threading.RLock()
+
+# Queue of (job, args, future) consumed by the writer thread, created per process
+_write_queue = None
+_writer_thread = None
+_writer_pid = None
+_writer_start_lock = threading.Lock()
+
+# Maximum queued writes committed together in one transaction
+_WRITE_GROUP_SIZE = 32
+
+def _reset_locks_after_fork():
+    """
+    Give a forked child fresh locks
+    The parent's writer thread may have held them at fork time, and it
+    doesn't exist in the child to release them
+    """
+    global _write_lock, _writer_start_lock
+    
+    _write_lock = threading.RLock()
+    _writer_start_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+# Idle read-only connections, recreated per process like _conn
+_read_pool = queue.LifoQueue(maxsize=DB_READ_POOL_SIZE)
+_read_pool_pid = None
+
+# Prepared statements kept per connection (sqlite3 default is 128); every
+# query here is a constant SQL string, so long-lived connections re-parse nothing
+_STATEMENT_CACHE_SIZE = 256
+
+# Per-connection tuning applied to every handle, writer and readers alike
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",     # 64 MB page cache
+    "PRAGMA mmap_size=268435456",   # 256 MB memory-mapped I/O
+    "PRAGMA foreign_keys=ON",
+)
+
+def _apply_pragmas(conn):
+    """
+    Apply the per-connection PRAGMAs to a new connection
+    
+    Args:
+        conn (sqlite3.Connection): Freshly opened connection
+    """
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
 def get_connection():
     """
-    Create and return a database connection
+    Return the shared database connection
+    The connection is opened on first use and reopened in forked worker
+    processes, which must not share a SQLite handle with their parent.
+    Only the writer thread uses it (see run_write); callers must not close it
     
     Returns:
         sqlite3.Connection: Database connection object
     """
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
-    return conn
+    global _conn, _conn_pid
+    
+    if _conn is None or _conn_pid != os.getpid():
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False,
+                               cached_statements=_STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        
+        # WAL lets readers run alongside a writer; NORMAL sync avoids an fsync per commit.
+        # journal_mode is stored in the database file, the rest are per-connection
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _apply_pragmas(conn)
+        
+        _conn, _conn_pid = conn, os.getpid()
+    
+    return _conn
+
+@contextmanager
+def read_connection():
+    """
+    Borrow a read-only connection from the pool
+    Readers get their own handle so they never share a cursor with, or see
+    the uncommitted rows of, a write transaction on the shared connection.
+    WAL mode lets these readers run while a write is in progress
+    
+    Yields:
+        sqlite3.Connection: Read-only database connection
+    """
+    global _read_pool, _read_pool_pid
+    
+    if _read_pool_pid != os.getpid():
+        _read_pool, _read_pool_pid = queue.LifoQueue(maxsize=DB_READ_POOL_SIZE), os.getpid()
+    
+    pool = _read_pool
+    
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        uri = Path(DB_PATH).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                               cached_statements=_STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        _apply_pragmas(conn)
+    
+    try:
+        yield conn
+    finally:
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+def close_connections():
+    """
+    Close the shared connection and all pooled read connections
+    Registered with atexit; only closes handles owned by this process
+    """
+    global _conn
+    
+    if _conn is not None and _conn_pid == os.getpid():
+        _conn.close()
+        _conn = None
+    
+    if _read_pool_pid == os.getpid():
+        while True:
+            try:
+                _read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+atexit.register(close_connections)
+
+@contextmanager
+def db_cursor():
+    """
+    Open a cursor on a pooled read-only connection
+    
+    Yields:
+        sqlite3.Cursor: Cursor to run queries on
+    """
+    with read_connection() as conn:
+        yield conn.cursor()
+
+def _writer_loop(write_queue):
+    """
+    Run queued write jobs on the shared connection, forever
+    Jobs already waiting are committed together in one BEGIN IMMEDIATE
+    transaction (group commit). Each job runs inside its own savepoint, so
+    a failing job is rolled back alone and the others still commit.
+    The connection is (re)opened per group, so if the database can't be
+    opened the group's futures fail with that error and the thread lives on
+    
+    Args:
+        write_queue (queue.Queue): Queue of (job, args, future) tuples
+    """
+    while True:
+        group = [write_queue.get()]
+        while len(group) < _WRITE_GROUP_SIZE:
+            try:
+                group.append(write_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        outcomes = []
+        
+        with _write_lock:
+            try:
+                conn = get_connection()
+                
+                with conn:
+                    cursor = conn.cursor()
+                    
+                    # Take SQLite's write lock up front instead of upgrading mid-transaction
+                    cursor.execute("BEGIN IMMEDIATE")
+                    
+                    for job, args, future in group:
+                        cursor.execute("SAVEPOINT write_job")
+                        try:
+                            outcomes.append((future, job(cursor, *args), None))
+                        except Exception as e:
+                            cursor.execute("ROLLBACK TO SAVEPOINT write_job")
+                            outcomes.append((future, None, e))
+                        cursor.execute("RELEASE SAVEPOINT write_job")
+                
+            except Exception as e:
+                # The transaction as a whole failed: nothing in the group was written
+                outcomes = [(future, None, e) for _, _, future in group]
+        
+        # Resolve futures only once the outcome is durable
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+def run_write(job, *args):
+    """
+    Run a write job on the writer thread and wait for its result
+    All writes are serialized through one background thread that owns the
+    shared connection, while readers use the read-only pool
+    
+    Args:
+        job (callable): Function called as job(cursor, *args) inside a
+                        write transaction; its return value is passed back
+        *args: Extra arguments for job
+        
+    Returns:
+        Any: The job's return value (exceptions raised by the job are re-raised)
+        
+    Raises:
+        concurrent.futures.TimeoutError: If the write isn't committed within
+            DB_WRITE_TIMEOUT seconds; the job may still run later
+    """
+    global _write_queue, _writer_thread, _writer_pid
+    
+    with _writer_start_lock:
+        # Threads don't survive fork, so each process starts its own writer;
+        # a writer that died is replaced (jobs it left queued are kept)
+        if _writer_pid != os.getpid():
+            _write_queue = queue.Queue()
+            _writer_thread = None
+            _writer_pid = os.getpid()
+        
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop,
+                args=(_write_queue,),
+                name="db-writer",
+                daemon=True
+            )
+            _writer_thread.start()
+    
+    future = Future()
+    _write_queue.put((job, args, future))
+    
+    return future.result(timeout=DB_WRITE_TIMEOUT)
 
 def initialize_database():
     """
     Initialize database and create all required tables
     This function is called when the app starts
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Create users table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # Create feedback table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS feedback (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            feedback_text TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    """)
-    
-    # Create features table (clusters)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS features (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            feature_name TEXT NOT NULL,
-            cluster_id INTEGER,
-            reach INTEGER DEFAULT 0,
-            impact INTEGER DEFAULT 0,
-            confidence INTEGER DEFAULT 80,
-            effort INTEGER DEFAULT 0,
-            rice_score REAL DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    """)
-    
-    # Create feedback_feature mapping table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS feedback_feature_mapping (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            feedback_id INTEGER NOT NULL,
-            feature_id INTEGER NOT NULL,
-            FOREIGN KEY (feedback_id) REFERENCES feedback (id),
-            FOREIGN KEY (feature_id) REFERENCES features (id)
-        )
-    """)
+    def create_schema(cursor):
+        # Create users table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                email TEXT UNIQUE NOT NULL,
+                password TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Create feedback table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS feedback (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                feedback_text TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users (id)
+            )
+        """)
+        
+        # Create features table (clusters)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS features (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                feature_name TEXT NOT NULL,
+                cluster_id INTEGER,
+                reach INTEGER DEFAULT 0,
+                impact INTEGER DEFAULT 0,
+                confidence INTEGER DEFAULT 80,
+                effort INTEGER DEFAULT 0,
+                rice_score REAL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users (id)
+            )
+        """)
+        
+        # Create feedback_feature mapping table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS feedback_feature_mapping (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feedback_id INTEGER NOT NULL,
+                feature_id INTEGER NOT NULL,
+                FOREIGN KEY (feedback_id) REFERENCES feedback (id),
+                FOREIGN KEY (feature_id) REFERENCES features (id)
+            )
+        """)
+        
+        # Create embeddings cache table (content-addressed by text hash)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                text_hash BLOB PRIMARY KEY,
+                embedding BLOB NOT NULL
+            )
+        """)
+        
+        # Index the user_id foreign keys every per-user query filters on;
+        # created_at also covers get_user_feedback's ORDER BY
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_feedback_user_created
+            ON feedback(user_id, created_at DESC)
+        """)
+        
+        # Leading user_id column also serves plain per-user feature lookups;
+        # rice_score covers the top/scored queries ordered by RICE score
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_features_user_rice
+            ON features(user_id, rice_score DESC)
+        """)
+        
+        # Mapping table lookups from either side
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ffm_feedback ON feedback_feature_mapping(feedback_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ffm_feature ON feedback_feature_mapping(feature_id)")
     
-    conn.commit()
-    conn.close()
+    run_write(create_schema)
     
     print(f"✅ Database initialized successfully at: {DB_PATH}")
 
@@ -105,60 +370,114 @@ def create_user(name, email, hashed_password):
         tuple: (success: bool, message: str, user_id: int or None)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Check if email already exists
-        cursor.execute("SELECT id FROM users WHERE email = ?", (email,))
-        if cursor.fetchone():
-            conn.close()
+        def insert_user(cursor):
+            # Insert new user; the UNIQUE index on email rejects duplicates
+            try:
+                cursor.execute(
+                    "INSERT INTO users (name, email, password) VALUES (?, ?, ?)",
+                    (name, email, hashed_password)
+                )
+            except sqlite3.IntegrityError as e:
+                if "users.email" not in str(e):
+                    raise
+                return None
+            
+            return cursor.lastrowid
+        
+        user_id = run_write(insert_user)
+        
+        if user_id is None:
             return False, "Email already exists", None
         
-        # Insert new user
-        cursor.execute(
-            "INSERT INTO users (name, email, password) VALUES (?, ?, ?)",
-            (name, email, hashed_password)
-        )
-        
-        user_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        _invalidate_user_cache()
         
         return True, "User created successfully", user_id
         
     except Exception as e:
         return False, f"Error creating user: {str(e)}", None
 
-def get_user_by_email(email):
+class _UserNotFound(Exception):
     """
-    Retrieve user by email
+    Raised by the cached user lookups for a missing user, so that misses
+    are never cached (lru_cache doesn't store exceptions)
+    """
+
+def _invalidate_user_cache():
+    """
+    Drop cached user lookups
+    Call after any change to the users table
+    """
+    _fetch_user_by_email.cache_clear()
+    _fetch_user_by_id.cache_clear()
+
+@functools.lru_cache(maxsize=1024)
+def _fetch_user_by_email(email):
+    """
+    Cached user lookup by email
+    Results are immutable (column, value) pairs so cached entries can't be
+    modified by callers; errors propagate and are never cached
     
     Args:
         email (str): User's email
         
     Returns:
-        dict or None: User data if found, None otherwise
-    """
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        tuple: User row as (column, value) pairs
         
+    Raises:
+        _UserNotFound: If no user has this email
+    """
+    with db_cursor() as cursor:
         cursor.execute(
             "SELECT id, name, email, password, created_at FROM users WHERE email = ?",
             (email,)
         )
         
         row = cursor.fetchone()
-        conn.close()
+        if row is None:
+            raise _UserNotFound(email)
         
-        if row:
-            return {
-                "id": row[0],
-                "name": row[1],
-                "email": row[2],
-                "password": row[3],
-                "created_at": row[4]
-            }
+        return tuple(zip(row.keys(), row))
+
+@functools.lru_cache(maxsize=1024)
+def _fetch_user_by_id(user_id):
+    """
+    Cached user lookup by ID
+    
+    Args:
+        user_id (int): User's ID
+        
+    Returns:
+        tuple: User row as (column, value) pairs
+        
+    Raises:
+        _UserNotFound: If no user has this ID
+    """
+    with db_cursor() as cursor:
+        cursor.execute(
+            "SELECT id, name, email, created_at FROM users WHERE id = ?",
+            (user_id,)
+        )
+        
+        row = cursor.fetchone()
+        if row is None:
+            raise _UserNotFound(user_id)
+        
+        return tuple(zip(row.keys(), row))
+
+def get_user_by_email(email):
+    """
+    Retrieve user by email
+    
+    Args:
+        email (str): User's email
+        
+    Returns:
+        dict or None: User data if found, None otherwise
+    """
+    try:
+        return dict(_fetch_user_by_email(email))
+        
+    except _UserNotFound:
         return None
         
     except Exception as e:
@@ -176,24 +495,9 @@ def get_user_by_id(user_id):
         dict or None: User data if found, None otherwise
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        return dict(_fetch_user_by_id(user_id))
         
-        cursor.execute(
-            "SELECT id, name, email, created_at FROM users WHERE id = ?",
-            (user_id,)
-        )
-        
-        row = cursor.fetchone()
-        conn.close()
-        
-        if row:
-            return {
-                "id": row[0],
-                "name": row[1],
-                "email": row[2],
-                "created_at": row[3]
-            }
+    except _UserNotFound:
         return None
         
     except Exception as e:
@@ -219,59 +523,94 @@ def create_feedback(user_id, feedback_text):
         if not feedback_text or not feedback_text.strip():
             return False, "Feedback text cannot be empty", None
         
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "INSERT INTO feedback (user_id, feedback_text) VALUES (?, ?)",
-            (user_id, feedback_text.strip())
-        )
+        def insert_feedback(cursor):
+            cursor.execute(
+                "INSERT INTO feedback (user_id, feedback_text) VALUES (?, ?)",
+                (user_id, feedback_text.strip())
+            )
+            
+            return cursor.lastrowid
         
-        feedback_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        feedback_id = run_write(insert_feedback)
         
         return True, "Feedback added successfully", feedback_id
         
     except Exception as e:
         return False, f"Error adding feedback: {str(e)}", None
 
+# Rows per multi-row INSERT; 2 bound variables per row stays well under
+# SQLite's default limit of 999 variables per statement
+_INSERT_ROWS_PER_STATEMENT = 100
+
+def _feedback_insert_sql(n_rows):
+    """
+    Build a feedback INSERT statement with n_rows VALUES groups
+    
+    Args:
+        n_rows (int): Number of rows inserted by the statement
+        
+    Returns:
+        str: SQL statement taking 2 * n_rows parameters
+    """
+    return (
+        "INSERT INTO feedback (user_id, feedback_text) VALUES "
+        + ",".join(["(?, ?)"] * n_rows)
+    )
+
+_FEEDBACK_INSERT_SQL = _feedback_insert_sql(_INSERT_ROWS_PER_STATEMENT)
+
 def create_feedback_batch(user_id, feedback_list):
     """
     Create multiple feedback entries at once
     
     Args:
         user_id (int): ID of the user submitting feedback
-        feedback_list (list): List of feedback text strings
+        feedback_list (iterable): Feedback text strings (list or pandas Series)
         
     Returns:
         tuple: (success: bool, message: str, count: int)
     """
+    # Filter out empty feedback
+    valid_feedback = [f.strip() for f in feedback_list if f and f.strip()]
+    
+    if not valid_feedback:
+        return False, "No valid feedback to import", 0
+    
+    def insert_chunk(cursor, chunk):
+        # Full groups reuse one cached multi-row statement
+        full = len(chunk) - len(chunk) % _INSERT_ROWS_PER_STATEMENT
+        if full:
+            cursor.executemany(
+                _FEEDBACK_INSERT_SQL,
+                (
+                    [value for feedback in chunk[i:i + _INSERT_ROWS_PER_STATEMENT]
+                     for value in (user_id, feedback)]
+                    for i in range(0, full, _INSERT_ROWS_PER_STATEMENT)
+                )
+            )
+        
+        # Remaining rows go in one shorter statement
+        tail = chunk[full:]
+        if tail:
+            cursor.execute(
+                _feedback_insert_sql(len(tail)),
+                [value for feedback in tail for value in (user_id, feedback)]
+            )
+    
+    count = 0
+    
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Filter out empty feedback
-        valid_feedback = [f.strip() for f in feedback_list if f and f.strip()]
-        
-        if not valid_feedback:
-            conn.close()
-            return False, "No valid feedback to import", 0
-        
-        # Insert all feedback
-        cursor.executemany(
-            "INSERT INTO feedback (user_id, feedback_text) VALUES (?, ?)",
-            [(user_id, feedback) for feedback in valid_feedback]
-        )
-        
-        count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        # One write job per chunk
+        for start in range(0, len(valid_feedback), DB_WRITE_CHUNK_SIZE):
+            chunk = valid_feedback[start:start + DB_WRITE_CHUNK_SIZE]
+            
+            run_write(insert_chunk, chunk)
+            count += len(chunk)
         
         return True, f"Successfully imported {count} feedback entries", count
         
     except Exception as e:
-        return False, f"Error importing feedback: {str(e)}", 0
+        return False, f"Error importing feedback after {count} entries: {str(e)}", count
 
 def get_user_feedback(user_id, limit=None):
     """
@@ -282,35 +621,23 @@ def get_user_feedback(user_id, limit=None):
         limit (int, optional): Maximum number of feedback to return
         
     Returns:
-        list: List of feedback dictionaries
+        list: List of feedback rows (sqlite3.Row, indexable by column name)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT id, feedback_text, created_at 
-            FROM feedback 
-            WHERE user_id = ? 
-            ORDER BY created_at DESC
-        """
-        
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        cursor.execute(query, (user_id,))
-        rows = cursor.fetchall()
-        conn.close()
-        
-        feedback_list = []
-        for row in rows:
-            feedback_list.append({
-                "id": row[0],
-                "feedback_text": row[1],
-                "created_at": row[2]
-            })
-        
-        return feedback_list
+        with db_cursor() as cursor:
+            query = """
+                SELECT id, feedback_text, created_at 
+                FROM feedback 
+                WHERE user_id = ? 
+                ORDER BY created_at DESC
+                LIMIT ?
+            """
+            
+            # Bound LIMIT keeps the SQL text constant; a negative LIMIT means no limit
+            cursor.execute(query, (user_id, limit if limit else -1))
+            
+            # Rows support row['column'] lookups, so no per-row dict is built
+            return cursor.fetchall()
         
     except Exception as e:
         print(f"Error fetching feedback: {str(e)}")
@@ -327,18 +654,17 @@ def get_feedback_count(user_id):
         int: Number of feedback entries
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT COUNT(*) FROM feedback WHERE user_id = ?",
-            (user_id,)
-        )
-        
-        count = cursor.fetchone()[0]
-        conn.close()
-        
-        return count
+        # Counted on the (user_id, created_at) index, so always current
+        # even when another process has written
+        with db_cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) FROM feedback WHERE user_id = ?",
+                (user_id,)
+            )
+            
+            count = cursor.fetchone()[0]
+            
+            return count
         
     except Exception as e:
         print(f"Error counting feedback: {str(e)}")
@@ -356,128 +682,138 @@ def delete_feedback(feedback_id, user_id):
         tuple: (success: bool, message: str)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Verify ownership before deleting
-        cursor.execute(
-            "DELETE FROM feedback WHERE id = ? AND user_id = ?",
-            (feedback_id, user_id)
-        )
-        
-        if cursor.rowcount == 0:
-            conn.close()
+        def delete(cursor):
+            # Verify ownership before deleting
+            cursor.execute(
+                "DELETE FROM feedback WHERE id = ? AND user_id = ?",
+                (feedback_id, user_id)
+            )
+            
+            return cursor.rowcount > 0
+        
+        if not run_write(delete):
             return False, "Feedback not found or unauthorized"
         
-        conn.commit()
-        conn.close()
-        
         return True, "Feedback deleted successfully"
         
     except Exception as e:
         return False, f"Error deleting feedback: {str(e)}"
 
-# ============================================
-# FEATURE OPERATIONS (Clustering Results)
-# ============================================
+# IDs per DELETE ... IN (...) statement, under SQLite's default limit of
+# 999 variables per statement (one more is used for user_id)
+_DELETE_IDS_PER_STATEMENT = 900
 
-def clear_user_features(user_id):
+def delete_feedback_bulk(user_id, feedback_ids):
     """
-    Delete all existing features for a user
-    Used before running new clustering
+    Delete several feedback entries (only those belonging to the user)
+    All rows are deleted in one transaction, so either every matching row
+    is removed or none is
     
     Args:
-        user_id (int): User's ID
+        user_id (int): User's ID (for security)
+        feedback_ids (list): Feedback IDs to delete
         
     Returns:
-        tuple: (success: bool, message: str)
+        tuple: (success: bool, message: str, count: int)
     """
+    feedback_ids = [int(feedback_id) for feedback_id in feedback_ids]
+    
+    if not feedback_ids:
+        return False, "No feedback selected", 0
+    
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "DELETE FROM features WHERE user_id = ?",
-            (user_id,)
-        )
-        
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
-        
-        return True, f"Cleared {deleted_count} existing features"
+        def delete(cursor):
+            deleted = 0
+            
+            for start in range(0, len(feedback_ids), _DELETE_IDS_PER_STATEMENT):
+                chunk = feedback_ids[start:start + _DELETE_IDS_PER_STATEMENT]
+                
+                # Verify ownership before deleting
+                cursor.execute(
+                    f"DELETE FROM feedback WHERE user_id = ? AND id IN ({','.join('?' * len(chunk))})",
+                    [user_id, *chunk]
+                )
+                deleted += cursor.rowcount
+            
+            return deleted
+        
+        count = run_write(delete)
+        
+        if count == 0:
+            return False, "Feedback not found or unauthorized", 0
+        
+        return True, f"Deleted {count} feedback items", count
         
     except Exception as e:
-        return False, f"Error clearing features: {str(e)}"
+        return False, f"Error deleting feedback: {str(e)}", 0
+
+# ============================================
+# FEATURE OPERATIONS (Clustering Results)
+# ============================================
 
-def create_feature(user_id, feature_name, reach):
+def replace_user_features(user_id, features_list):
     """
-    Create a new feature from clustering
+    Replace all of a user's features with a new set in one transaction
+    Readers see either the old features or the new ones, never an empty set
     
     Args:
         user_id (int): User's ID
-        feature_name (str): Name of the feature (from representative feedback)
-        reach (int): Number of feedback items in this cluster
+        features_list (list): List of feature dictionaries with
+                              'feature_name' and 'reach'
         
     Returns:
-        tuple: (success: bool, message: str, feature_id: int or None)
+        tuple: (success: bool, message: str, count: int)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "INSERT INTO features (user_id, feature_name, reach) VALUES (?, ?, ?)",
-            (user_id, feature_name, reach)
-        )
-        
-        feature_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return True, "Feature created", feature_id
+        def replace_features(cursor):
+            cursor.execute(
+                "DELETE FROM features WHERE user_id = ?",
+                (user_id,)
+            )
+            
+            cursor.executemany(
+                "INSERT INTO features (user_id, feature_name, reach) VALUES (?, ?, ?)",
+                ((user_id, f['feature_name'], f['reach']) for f in features_list)
+            )
+            
+            return cursor.rowcount
+        
+        count = run_write(replace_features)
+        
+        return True, f"Created {count} features", count
         
     except Exception as e:
-        return False, f"Error creating feature: {str(e)}", None
+        return False, f"Error replacing features: {str(e)}", 0
 
-def get_user_features(user_id):
+def get_user_features(user_id, unscored_only=False):
     """
     Retrieve all features for a user
     
     Args:
         user_id (int): User's ID
+        unscored_only (bool): Only return features without a RICE score
         
     Returns:
-        list: List of feature dictionaries
+        list: List of feature rows (sqlite3.Row, indexable by column name)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT id, feature_name, reach, impact, confidence, effort, rice_score, created_at
-            FROM features
-            WHERE user_id = ?
-            ORDER BY reach DESC
-        """, (user_id,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        features = []
-        for row in rows:
-            features.append({
-                "id": row[0],
-                "feature_name": row[1],
-                "reach": row[2],
-                "impact": row[3],
-                "confidence": row[4],
-                "effort": row[5],
-                "rice_score": row[6],
-                "created_at": row[7]
-            })
-        
-        return features
+        with db_cursor() as cursor:
+            if unscored_only:
+                cursor.execute("""
+                    SELECT id, feature_name, reach, impact, confidence, effort, rice_score, created_at
+                    FROM features
+                    WHERE user_id = ? AND (rice_score IS NULL OR rice_score = 0)
+                    ORDER BY reach DESC
+                """, (user_id,))
+            else:
+                cursor.execute("""
+                    SELECT id, feature_name, reach, impact, confidence, effort, rice_score, created_at
+                    FROM features
+                    WHERE user_id = ?
+                    ORDER BY reach DESC
+                """, (user_id,))
+            
+            return cursor.fetchall()
         
     except Exception as e:
         print(f"Error fetching features: {str(e)}")
@@ -494,23 +830,51 @@ def get_feature_count(user_id):
         int: Number of features
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT COUNT(*) FROM features WHERE user_id = ?",
-            (user_id,)
-        )
-        
-        count = cursor.fetchone()[0]
-        conn.close()
-        
-        return count
+        with db_cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) FROM features WHERE user_id = ?",
+                (user_id,)
+            )
+            
+            count = cursor.fetchone()[0]
+            
+            return count
         
     except Exception as e:
         print(f"Error counting features: {str(e)}")
         return 0
 
+def get_feature_score_counts(user_id):
+    """
+    Count a user's features and how many of them have a RICE score
+    
+    Args:
+        user_id (int): User's ID
+        
+    Returns:
+        dict: Dictionary with feature_count and scored_count
+    """
+    try:
+        with db_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(rice_score IS NOT NULL AND rice_score > 0), 0)
+                FROM features
+                WHERE user_id = ?
+            """, (user_id,))
+            
+            row = cursor.fetchone()
+            
+            return {
+                "feature_count": row[0],
+                "scored_count": row[1]
+            }
+        
+    except Exception as e:
+        print(f"Error counting scored features: {str(e)}")
+        return {"feature_count": 0, "scored_count": 0}
+
 def update_feature_score(feature_id, user_id, impact, effort, confidence, rice_score):
     """
     Update RICE scoring for a feature
@@ -527,28 +891,56 @@ def update_feature_score(feature_id, user_id, impact, effort, confidence, rice_s
         tuple: (success: bool, message: str)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Update only if feature belongs to user
-        cursor.execute("""
-            UPDATE features 
-            SET impact = ?, effort = ?, confidence = ?, rice_score = ?
-            WHERE id = ? AND user_id = ?
-        """, (impact, effort, confidence, rice_score, feature_id, user_id))
-        
-        if cursor.rowcount == 0:
-            conn.close()
+        def update_score(cursor):
+            # Update only if feature belongs to user
+            cursor.execute("""
+                UPDATE features 
+                SET impact = ?, effort = ?, confidence = ?, rice_score = ?
+                WHERE id = ? AND user_id = ?
+            """, (impact, effort, confidence, rice_score, feature_id, user_id))
+            
+            return cursor.rowcount
+        
+        if run_write(update_score) == 0:
             return False, "Feature not found or unauthorized"
         
-        conn.commit()
-        conn.close()
-        
         return True, "Feature scored successfully"
         
     except Exception as e:
         return False, f"Error updating feature score: {str(e)}"
 
+def update_feature_scores_bulk(user_id, scores):
+    """
+    Update RICE scoring for multiple features in a single transaction
+    
+    Args:
+        user_id (int): User's ID (for security)
+        scores (list): List of (feature_id, impact, effort, confidence, rice_score) tuples
+        
+    Returns:
+        tuple: (success: bool, message: str, count: int)
+    """
+    try:
+        def update_scores(cursor):
+            # Update only features that belong to user
+            cursor.executemany("""
+                UPDATE features 
+                SET impact = ?, effort = ?, confidence = ?, rice_score = ?
+                WHERE id = ? AND user_id = ?
+            """, [
+                (impact, effort, confidence, rice_score, feature_id, user_id)
+                for feature_id, impact, effort, confidence, rice_score in scores
+            ])
+            
+            return cursor.rowcount
+        
+        count = run_write(update_scores)
+        
+        return True, f"Scored {count} features", count
+        
+    except Exception as e:
+        return False, f"Error updating feature scores: {str(e)}", 0
+
 def get_prioritized_features(user_id, limit=None):
     """
     Get features sorted by RICE score (highest first)
@@ -559,45 +951,137 @@ def get_prioritized_features(user_id, limit=None):
         limit (int, optional): Maximum number to return
         
     Returns:
-        list: List of feature dictionaries sorted by RICE score
+        list: List of feature dictionaries sorted by RICE score,
+              each including its priority_level ("High", "Medium", "Low")
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT id, feature_name, reach, impact, confidence, effort, rice_score, created_at
-            FROM features
-            WHERE user_id = ? AND rice_score IS NOT NULL AND rice_score > 0
-            ORDER BY rice_score DESC
-        """
-        
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        cursor.execute(query, (user_id,))
-        rows = cursor.fetchall()
-        conn.close()
-        
-        features = []
-        for row in rows:
-            features.append({
-                "id": row[0],
-                "feature_name": row[1],
-                "reach": row[2],
-                "impact": row[3],
-                "confidence": row[4],
-                "effort": row[5],
-                "rice_score": row[6],
-                "created_at": row[7]
-            })
-        
-        return features
+        with db_cursor() as cursor:
+            # Priority level is classified in SQL (same thresholds as
+            # scoring.rice_scoring.get_priority_level)
+            query = """
+                SELECT id, feature_name, reach, impact, confidence, effort, rice_score, created_at,
+                       CASE
+                           WHEN rice_score >= ? THEN 'High'
+                           WHEN rice_score >= ? THEN 'Medium'
+                           ELSE 'Low'
+                       END AS priority_level
+                FROM features
+                WHERE user_id = ? AND rice_score IS NOT NULL AND rice_score > 0
+                ORDER BY rice_score DESC
+                LIMIT ?
+            """
+            
+            cursor.execute(query, (
+                RICE_HIGH_THRESHOLD,
+                RICE_MEDIUM_THRESHOLD,
+                user_id,
+                limit if limit else -1
+            ))
+            
+            return [dict(row) for row in cursor.fetchall()]
         
     except Exception as e:
         print(f"Error fetching prioritized features: {str(e)}")
         return []
 
+# ============================================
+# DASHBOARD OPERATIONS
+# ============================================
+
+def get_dashboard_summary(user_id):
+    """
+    Get feedback, feature and scored-feature counts in a single query
+    
+    Args:
+        user_id (int): User's ID
+        
+    Returns:
+        dict: Dictionary with feedback_count, feature_count and scored_count
+    """
+    try:
+        with db_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM feedback WHERE user_id = ?),
+                    (SELECT COUNT(*) FROM features WHERE user_id = ?),
+                    (SELECT COUNT(*) FROM features
+                     WHERE user_id = ? AND rice_score IS NOT NULL AND rice_score > 0)
+            """, (user_id, user_id, user_id))
+            
+            row = cursor.fetchone()
+            
+            return {
+                "feedback_count": row[0],
+                "feature_count": row[1],
+                "scored_count": row[2]
+            }
+        
+    except Exception as e:
+        print(f"Error fetching dashboard summary: {str(e)}")
+        return {"feedback_count": 0, "feature_count": 0, "scored_count": 0}
+
+# ============================================
+# EMBEDDING CACHE OPERATIONS
+# ============================================
+
+def get_cached_embeddings(text_hashes):
+    """
+    Retrieve cached embeddings for a list of text hashes
+    
+    Args:
+        text_hashes (list): List of text hashes (bytes)
+        
+    Returns:
+        dict: Mapping of text_hash to embedding (raw float32 bytes)
+    """
+    try:
+        with db_cursor() as cursor:
+            cached = {}
+            
+            # Query in chunks to stay below SQLite's bound-variable limit
+            chunk_size = 500
+            for start in range(0, len(text_hashes), chunk_size):
+                chunk = list(text_hashes[start:start + chunk_size])
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT text_hash, embedding FROM embeddings WHERE text_hash IN ({placeholders})",
+                    chunk
+                )
+                for row in cursor.fetchall():
+                    cached[row[0]] = row[1]
+            
+            return cached
+        
+    except Exception as e:
+        print(f"Error fetching embeddings: {str(e)}")
+        return {}
+
+def save_cached_embeddings(rows):
+    """
+    Store embeddings in the cache
+    
+    Args:
+        rows (list): List of (text_hash, embedding) tuples,
+                     with the embedding as raw float32 bytes
+        
+    Returns:
+        tuple: (success: bool, message: str)
+    """
+    try:
+        def insert_embeddings(cursor):
+            cursor.executemany(
+                "INSERT OR REPLACE INTO embeddings (text_hash, embedding) VALUES (?, ?)",
+                rows
+            )
+        
+        run_write(insert_embeddings)
+        
+        return True, f"Cached {len(rows)} embeddings"
+        
+    except Exception as e:
+        return False, f"Error caching embeddings: {str(e)}"
+
 if __name__ == "__main__":
     # Initialize database when this module is run directly
+    # (from the project root: python -m database.db)
     initialize_database()
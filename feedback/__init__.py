@@ -0,0 +1,3 @@
+"""
+Feedback package: feedback submission and CSV import
+"""
@@ -4,12 +4,8 @@ Handles feedback input, CSV uploads, and storage
 """
 
 import pandas as pd
-import sys
-import os
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from database.db import create_feedback, create_feedback_batch, get_user_feedback, get_feedback_count, delete_feedback
+from database.db import create_feedback, create_feedback_batch, get_user_feedback, get_feedback_count, delete_feedback, delete_feedback_bulk
 import config
 
 # ============================================
@@ -58,19 +54,19 @@ def validate_csv(df):
     Returns:
         tuple: (is_valid: bool, message: str, column_name: str or None)
     """
-    if df is None or df.empty:
+    if df is None:
         return False, "CSV file is empty", None
     
     # Check for 'feedback' column (case-insensitive)
-    feedback_col = None
-    for col in df.columns:
-        if col.lower() == 'feedback':
-            feedback_col = col
-            break
+    matches = df.columns[df.columns.str.lower() == 'feedback']
+    feedback_col = matches[0] if len(matches) else None
     
-    if not feedback_col:
+    if feedback_col is None:
         return False, "CSV must contain a 'feedback' column", None
     
+    if df.empty:
+        return False, "CSV file is empty", None
+    
     # Check if column has data
     non_empty = df[feedback_col].notna().sum()
     if non_empty == 0:
@@ -90,21 +86,26 @@ def process_csv(user_id, uploaded_file):
         tuple: (success: bool, message: str, count: int)
     """
     try:
-        # Read CSV file
-        df = pd.read_csv(uploaded_file)
+        # Read CSV file, parsing only the feedback column
+        df = pd.read_csv(
+            uploaded_file,
+            usecols=lambda col: str(col).lower() == 'feedback',
+            dtype="string"
+        )
         
         # Validate CSV structure
         is_valid, message, feedback_col = validate_csv(df)
         if not is_valid:
             return False, message, 0
         
-        # Extract feedback text (remove NaN values)
-        feedback_list = df[feedback_col].dropna().astype(str).tolist()
+        # Extract and strip feedback text (remove NaN values)
+        feedback_series = df[feedback_col].dropna().str.strip()
         
-        # Filter out very short feedback
-        feedback_list = [f for f in feedback_list if len(f.strip()) >= 10]
+        # Filter out very short feedback (vectorized); the Series is passed
+        # straight to the database layer without building a list first
+        feedback_series = feedback_series[feedback_series.str.len() >= 10]
         
-        if not feedback_list:
+        if feedback_series.empty:
             return False, "No valid feedback found (minimum 10 characters each)", 0
         
         # Check feedback limit
@@ -113,12 +114,12 @@ def process_csv(user_id, uploaded_file):
             return False, f"Feedback limit reached ({config.MAX_FEEDBACK_PER_USER}). Please delete some entries.", 0
         
         # Check if import would exceed limit
-        if current_count + len(feedback_list) > config.MAX_FEEDBACK_PER_USER:
+        if current_count + len(feedback_series) > config.MAX_FEEDBACK_PER_USER:
             allowed = config.MAX_FEEDBACK_PER_USER - current_count
-            return False, f"Cannot import {len(feedback_list)} items. Only {allowed} slots remaining (limit: {config.MAX_FEEDBACK_PER_USER}).", 0
+            return False, f"Cannot import {len(feedback_series)} items. Only {allowed} slots remaining (limit: {config.MAX_FEEDBACK_PER_USER}).", 0
         
         # Import to database
-        success, db_message, count = create_feedback_batch(user_id, feedback_list)
+        success, db_message, count = create_feedback_batch(user_id, feedback_series)
         
         return success, db_message, count
         
@@ -141,7 +142,7 @@ def get_all_feedback(user_id):
         user_id (int): ID of the user
         
     Returns:
-        list: List of feedback dictionaries
+        list: List of feedback rows (sqlite3.Row, indexable by column name)
     """
     return get_user_feedback(user_id)
 
@@ -178,3 +179,16 @@ def delete_feedback_item(feedback_id, user_id):
         tuple: (success: bool, message: str)
     """
     return delete_feedback(feedback_id, user_id)
+
+def delete_feedback_items(feedback_ids, user_id):
+    """
+    Delete several feedback entries in one transaction
+    
+    Args:
+        feedback_ids (list): IDs of the feedback to delete
+        user_id (int): ID of the logged-in user (for security)
+        
+    Returns:
+        tuple: (success: bool, message: str, count: int)
+    """
+    return delete_feedback_bulk(user_id, feedback_ids)
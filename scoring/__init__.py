@@ -0,0 +1,3 @@
+"""
+Scoring package: RICE scoring and prioritization
+"""
@@ -4,12 +4,15 @@ Handles feature scoring using the RICE framework
 RICE = (Reach × Impact × Confidence) / Effort
 """
 
-import sys
-import os
+import numpy as np
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from database.db import update_feature_score, get_user_features, get_prioritized_features
+from database.db import (
+    update_feature_score,
+    update_feature_scores_bulk,
+    get_user_features,
+    get_feature_score_counts,
+    get_prioritized_features
+)
 import config
 
 # ============================================
@@ -43,6 +46,30 @@ def calculate_rice_score(reach, impact, confidence, effort):
     # Round to 2 decimal places
     return round(rice_score, 2)
 
+def calculate_rice_scores(reach, impact, confidence, effort):
+    """
+    Calculate RICE scores for many features at once
+    Vectorized counterpart of calculate_rice_score; arguments may be
+    arrays/lists of equal length or scalars (broadcast to all rows)
+    
+    Args:
+        reach (array-like): Reach per feature
+        impact (array-like): Impact scores (1-5)
+        confidence (array-like): Confidence percentages (0-100)
+        effort (array-like): Effort scores (1-5)
+        
+    Returns:
+        np.ndarray: RICE scores rounded to 2 decimals (0.0 where effort is 0)
+    """
+    reach, impact, confidence, effort = (
+        np.asarray(a, dtype=np.float64) for a in (reach, impact, confidence, effort)
+    )
+    
+    no_effort = effort == 0
+    rice_scores = (reach * impact * (confidence / 100.0)) / np.where(no_effort, 1.0, effort)
+    
+    return np.round(np.where(no_effort, 0.0, rice_scores), 2)
+
 # ============================================
 # INPUT VALIDATION
 # ============================================
@@ -166,6 +193,63 @@ def score_feature(feature_id, user_id, reach, impact, effort, confidence=None):
     else:
         return False, db_message, None
 
+def score_features_bulk(user_id, rows, confidence=None):
+    """
+    Score several features at once and save them in one transaction
+    
+    Args:
+        user_id (int): User's ID
+        rows (list): List of dictionaries with 'id', 'reach', 'impact' and 'effort'
+        confidence (int, optional): Confidence percentage applied to every row.
+                                    If None, uses DEFAULT_CONFIDENCE from config
+        
+    Returns:
+        tuple: (success: bool, message: str, count: int)
+    """
+    # Use default confidence if not provided
+    if confidence is None:
+        confidence = config.DEFAULT_CONFIDENCE
+    
+    is_valid, message = validate_confidence(confidence)
+    if not is_valid:
+        return False, message, 0
+    
+    # Validate inputs
+    for row in rows:
+        is_valid, message = validate_impact(row['impact'])
+        if not is_valid:
+            return False, message, 0
+        
+        is_valid, message = validate_effort(row['effort'])
+        if not is_valid:
+            return False, message, 0
+    
+    if not rows:
+        return False, "No features to score", 0
+    
+    feature_ids = [int(row['id']) for row in rows]
+    impacts = [int(row['impact']) for row in rows]
+    efforts = [int(row['effort']) for row in rows]
+    
+    # Calculate all RICE scores in one vectorized pass
+    rice_scores = calculate_rice_scores(
+        [row['reach'] for row in rows], impacts, confidence, efforts
+    ).tolist()
+    
+    scores = [
+        (feature_id, impact, effort, confidence, rice_score)
+        for feature_id, impact, effort, rice_score
+        in zip(feature_ids, impacts, efforts, rice_scores)
+    ]
+    
+    # Update database
+    success, db_message, count = update_feature_scores_bulk(user_id, scores)
+    
+    if success:
+        return True, f"Scored {count} features", count
+    else:
+        return False, db_message, 0
+
 # ============================================
 # FEATURE PRIORITIZATION
 # ============================================
@@ -209,12 +293,7 @@ def get_unscored_features(user_id):
     Returns:
         list: List of unscored features
     """
-    all_features = get_user_features(user_id)
-    
-    # Filter for features without RICE scores
-    unscored = [f for f in all_features if f['rice_score'] is None or f['rice_score'] == 0]
-    
-    return unscored
+    return get_user_features(user_id, unscored_only=True)
 
 def get_scoring_stats(user_id):
     """
@@ -226,11 +305,10 @@ def get_scoring_stats(user_id):
     Returns:
         dict: Statistics dictionary
     """
-    all_features = get_user_features(user_id)
-    scored_features = get_all_scored_features(user_id)
+    counts = get_feature_score_counts(user_id)
     
-    total_features = len(all_features)
-    scored_count = len(scored_features)
+    total_features = counts['feature_count']
+    scored_count = counts['scored_count']
     unscored_count = total_features - scored_count
     
     return {
@@ -0,0 +1,3 @@
+"""
+Utilities package: shared helper functions
+"""
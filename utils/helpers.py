@@ -3,12 +3,58 @@ Utility functions
 Helper functions used across the application
 """
 
-import re
+import numpy as np
+import importlib.util
+import string
+import sys
+import threading
 from datetime import datetime
+from functools import lru_cache
+
+# Characters kept by clean_text besides whitespace
+_KEPT_CHARS = frozenset(string.ascii_lowercase + string.digits)
+
+class _CleanTable(dict):
+    """
+    str.translate table that lowercases and deletes every character except
+    a-z, 0-9 and whitespace, so one translate() does both steps. Code
+    points are classified on first sight and cached, so translate() then
+    runs as a C-level table lookup
+    """
+    def __missing__(self, codepoint):
+        # lower() can expand a character (e.g. "\u0130" -> "i\u0307"), so map to a string
+        kept = ''.join(char for char in chr(codepoint).lower() if char in _KEPT_CHARS or char.isspace())
+        value = kept or None
+        self[codepoint] = value
+        return value
+
+_CLEAN_TABLE = _CleanTable()
+
+# Classify Latin-1 at import so early requests don't pay __missing__ for common characters
+for _codepoint in range(256):
+    _CLEAN_TABLE[_codepoint]
+del _codepoint
+
+# bytes.translate table/delete set for the ASCII fast path: lowercases
+# A-Z, maps every whitespace byte to a space (bytes.split() does not treat
+# \x1c-\x1f as whitespace, str.split() does) and deletes everything else
+_ASCII_TABLE = bytes(
+    i + 32 if 65 <= i <= 90 else 32 if chr(i).isspace() else i
+    for i in range(256)
+)
+_ASCII_DELETE = bytes(
+    i for i in range(128)
+    if not (chr(i).lower() in _KEPT_CHARS or chr(i).isspace())
+)
+
+# Cleaned strings up to this length are interned
+_INTERN_MAX_LEN = 64
 
 def clean_text(text):
     """
     Clean and preprocess text for NLP
+    Results are memoized, so repeated inputs (duplicate feedback, titles)
+    are cleaned only once
     
     Args:
         text (str): Raw text input
@@ -19,17 +65,186 @@ def clean_text(text):
     if not text:
         return ""
     
-    # Convert to lowercase
-    text = text.lower()
+    return _clean_text_cached(text)
+
+@lru_cache(maxsize=4096)
+def _clean_text_cached(text):
+    """
+    Clean a non-empty string (memoized body of clean_text)
     
-    # Remove special characters but keep spaces
-    text = re.sub(r'[^a-z0-9\s]', '', text)
+    Args:
+        text (str): Raw text input
+        
+    Returns:
+        str: Cleaned text
+    """
+    if text.isascii():
+        # Same steps on bytes, where translate is a 256-entry table lookup
+        data = text.encode('ascii').translate(_ASCII_TABLE, _ASCII_DELETE)
+        text = b' '.join(data.split()).decode('ascii')
+    else:
+        # Lowercase and remove special characters (keeping spaces) in one pass
+        text = text.translate(_CLEAN_TABLE)
+        
+        # Remove extra whitespace
+        text = ' '.join(text.split())
     
-    # Remove extra whitespace
-    text = ' '.join(text.split())
+    # Intern short results (titles, keywords) so dict/set lookups and
+    # equality checks on them can short-circuit on identity
+    if len(text) <= _INTERN_MAX_LEN:
+        text = sys.intern(text)
     
     return text
 
+# Batches at least this large use the numba kernel for their ASCII texts
+_JIT_MIN_BATCH = 1000
+
+# numba signature of _clean_ascii_loop
+_KERNEL_SIGNATURE = "int64(uint8[::1], int64[::1], uint8[::1], int64[::1])"
+
+# Compiled _clean_ascii_loop: None until compiled, False if unavailable
+_clean_ascii_kernel = None
+_clean_ascii_kernel_lock = threading.Lock()
+
+def _clean_ascii_loop(buf, starts, out, out_starts):
+    """
+    Clean many ASCII texts packed into one byte buffer in a single pass
+    Lowercases, keeps only a-z/0-9 and collapses whitespace runs to one
+    space (trimmed at both ends), matching clean_text byte for byte.
+    Compiled with numba by _get_clean_ascii_kernel
+    
+    Args:
+        buf (np.ndarray): Concatenated input bytes
+        starts (np.ndarray): Offset of each text in buf, plus the total length
+        out (np.ndarray): Output buffer, at least len(buf) bytes
+        out_starts (np.ndarray): Receives the offset of each cleaned text in out
+        
+    Returns:
+        int: Number of bytes written to out
+    """
+    n = 0
+    for i in range(len(starts) - 1):
+        out_starts[i] = n
+        begin = n
+        pending_space = False
+        
+        for j in range(starts[i], starts[i + 1]):
+            c = buf[j]
+            if 65 <= c <= 90:  # A-Z
+                c += 32
+            
+            if 97 <= c <= 122 or 48 <= c <= 57:  # a-z, 0-9
+                if pending_space and n > begin:
+                    out[n] = 32
+                    n += 1
+                pending_space = False
+                out[n] = c
+                n += 1
+            elif c == 32 or 9 <= c <= 13 or 28 <= c <= 31:  # str.isspace() in ASCII
+                pending_space = True
+    
+    out_starts[len(starts) - 1] = n
+    return n
+
+def _get_clean_ascii_kernel():
+    """
+    Compile the ASCII cleaning kernel, once per process
+    numba is optional and only imported here, so importing this module
+    stays cheap. Any import or compile failure (including a broken on-disk
+    cache) disables the kernel for the process
+    
+    Returns:
+        callable or None: Compiled kernel, or None if numba can't be used
+    """
+    global _clean_ascii_kernel
+    
+    if _clean_ascii_kernel is None:
+        with _clean_ascii_kernel_lock:
+            if _clean_ascii_kernel is None:
+                try:
+                    from numba import njit
+                    _clean_ascii_kernel = njit(_KERNEL_SIGNATURE, cache=True)(_clean_ascii_loop)
+                except ImportError:
+                    _clean_ascii_kernel = False
+                except Exception as e:
+                    print(f"numba kernel unavailable, cleaning without it: {str(e)}")
+                    _clean_ascii_kernel = False
+    
+    return _clean_ascii_kernel or None
+
+# With numba installed, compile the kernel on a background thread at import,
+# so neither the import nor the first large batch waits for the compile
+if importlib.util.find_spec("numba") is not None:
+    threading.Thread(target=_get_clean_ascii_kernel, name="numba-warmup", daemon=True).start()
+
+def _clean_ascii_batch(kernel, texts):
+    """
+    Clean ASCII texts with the numba kernel
+    
+    Args:
+        kernel (callable): Compiled kernel from _get_clean_ascii_kernel
+        texts (list): Non-empty ASCII strings
+        
+    Returns:
+        list: Cleaned texts, in input order
+    """
+    encoded = [text.encode('ascii') for text in texts]
+    
+    buf = np.frombuffer(bytearray(b''.join(encoded)), dtype=np.uint8)
+    starts = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=starts[1:])
+    
+    out = np.empty(len(buf), dtype=np.uint8)
+    out_starts = np.empty_like(starts)
+    n = kernel(buf, starts, out, out_starts)
+    
+    data = out[:n].tobytes()
+    bounds = out_starts.tolist()
+    
+    return [data[a:b].decode('ascii') for a, b in zip(bounds, bounds[1:])]
+
+def clean_text_many(texts):
+    """
+    Clean a batch of texts (same result as clean_text on each item)
+    Runs the cleaning steps inline in one comprehension, avoiding a
+    Python function call per item. With numba installed, ASCII texts in
+    large batches are cleaned by a compiled single-pass kernel instead
+    
+    Args:
+        texts (iterable): Raw text inputs (list, pandas Series, ...)
+        
+    Returns:
+        list: Cleaned texts, in input order
+    """
+    table = _CLEAN_TABLE
+    texts = list(texts)
+    
+    kernel = _get_clean_ascii_kernel() if len(texts) >= _JIT_MIN_BATCH else None
+    if kernel is None:
+        return [' '.join(text.translate(table).split()) if text else "" for text in texts]
+    
+    cleaned = [""] * len(texts)
+    ascii_indices = []
+    
+    for i, text in enumerate(texts):
+        if not text:
+            continue
+        if text.isascii():
+            ascii_indices.append(i)
+        else:
+            cleaned[i] = ' '.join(text.translate(table).split())
+    
+    try:
+        ascii_cleaned = _clean_ascii_batch(kernel, [texts[i] for i in ascii_indices])
+    except Exception as e:
+        print(f"numba kernel failed, cleaning without it: {str(e)}")
+        ascii_cleaned = [' '.join(texts[i].translate(table).split()) for i in ascii_indices]
+    
+    for i, text in zip(ascii_indices, ascii_cleaned):
+        cleaned[i] = text
+    
+    return cleaned
+
 def format_timestamp(timestamp):
     """
     Format timestamp for display
@@ -40,16 +255,100 @@ def format_timestamp(timestamp):
     Returns:
         str: Formatted date string
     """
-    if isinstance(timestamp, str):
-        dt = datetime.fromisoformat(timestamp)
-    else:
-        dt = timestamp
+    formatter = _TIMESTAMP_FORMATTERS.get(type(timestamp))
+    
+    # Subclasses (e.g. pandas Timestamp) miss the exact-type lookup;
+    # dates and other date-like values go through strftime
+    if formatter is None:
+        if isinstance(timestamp, str):
+            formatter = _format_timestamp_str
+        elif isinstance(timestamp, datetime):
+            formatter = _format_datetime
+        else:
+            formatter = _format_strftime
+    
+    return formatter(timestamp)
+
+def _format_datetime(dt):
+    """
+    Format a datetime as "YYYY-MM-DD HH:MM"
+    Builds the fixed layout directly instead of parsing a strftime format;
+    anything that isn't a datetime (e.g. a date, which has no time fields)
+    goes through strftime
+    
+    Args:
+        dt (datetime): Timestamp to format
+        
+    Returns:
+        str: Formatted date string
+    """
+    if not isinstance(dt, datetime):
+        return _format_strftime(dt)
+    
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+def _format_strftime(value):
+    """
+    Format a date-like value with strftime
     
-    return dt.strftime("%Y-%m-%d %H:%M")
+    Args:
+        value: Object with a strftime method (date, time-less values, ...)
+        
+    Returns:
+        str: Formatted date string
+    """
+    return value.strftime("%Y-%m-%d %H:%M")
+
+@lru_cache(maxsize=2048)
+def _format_timestamp_str(timestamp):
+    """
+    Parse and format a timestamp string (memoized; rows often share one)
+    
+    Args:
+        timestamp (str): ISO-format timestamp, as stored by SQLite
+        
+    Returns:
+        str: Formatted date string
+    """
+    # "YYYY-MM-DD HH:MM..." (or with a "T") already starts with the answer
+    if (len(timestamp) >= 16 and timestamp[4] == '-' and timestamp[7] == '-'
+            and timestamp[10] in 'T ' and timestamp[13] == ':'):
+        return timestamp[:10] + ' ' + timestamp[11:16]
+    
+    return _format_datetime(datetime.fromisoformat(timestamp))
+
+# format_timestamp handlers by exact input type
+_TIMESTAMP_FORMATTERS = {
+    str: _format_timestamp_str,
+    datetime: _format_datetime
+}
+
+# validate_rice_input result codes, in check order (check i sets bit i)
+RICE_OK = 0
+RICE_ERR_REACH = 1
+RICE_ERR_IMPACT = 2
+RICE_ERR_CONFIDENCE = 3
+RICE_ERR_EFFORT = 4
+
+# Error message for each result code
+RICE_ERRORS = (
+    "",
+    "Reach must be a positive number",
+    "Impact must be between 1 and 5",
+    "Confidence must be between 0 and 100",
+    "Effort must be between 1 and 5"
+)
+
+# Shared (is_valid, code) result tuples, indexed by code
+_RICE_RESULTS = tuple((code == RICE_OK, code) for code in range(len(RICE_ERRORS)))
 
 def validate_rice_input(reach, impact, confidence, effort):
     """
     Validate RICE framework inputs
+    All four range checks are evaluated and combined into a bitmask; the
+    lowest set bit picks the code, so the first failing check wins.
+    Results are shared precomputed tuples. Use RICE_ERRORS[code] for the
+    message
     
     Args:
         reach (int): Number of users affected
@@ -58,18 +357,44 @@ def validate_rice_input(reach, impact, confidence, effort):
         effort (int): Effort score (1-5)
         
     Returns:
-        tuple: (is_valid, error_message)
+        tuple: (is_valid, code) - code is RICE_OK or a RICE_ERR_* value
     """
-    if reach < 0:
-        return False, "Reach must be a positive number"
+    bad = ((not reach >= 0)
+           | (not 1 <= impact <= 5) << 1
+           | (not 0 <= confidence <= 100) << 2
+           | (not 1 <= effort <= 5) << 3)
     
-    if impact < 1 or impact > 5:
-        return False, "Impact must be between 1 and 5"
+    return _RICE_RESULTS[(bad & -bad).bit_length()]
+
+def validate_rice_input_batch(reach, impact, confidence, effort):
+    """
+    Validate many rows of RICE inputs at once
+    Vectorized counterpart of validate_rice_input; each argument is an
+    array-like with one value per row
     
-    if confidence < 0 or confidence > 100:
-        return False, "Confidence must be between 0 and 100"
+    Args:
+        reach (array-like): Number of users affected per row
+        impact (array-like): Impact scores (1-5)
+        confidence (array-like): Confidence percentages (0-100)
+        effort (array-like): Effort scores (1-5)
+        
+    Returns:
+        tuple: (valid: np.ndarray of bool, codes: np.ndarray of int)
+               codes holds validate_rice_input's code for each row
+               (RICE_OK or a RICE_ERR_* value)
+    """
+    reach, impact, confidence, effort = map(np.asarray, (reach, impact, confidence, effort))
     
-    if effort < 1 or effort > 5:
-        return False, "Effort must be between 1 and 5"
+    # Negated in-range checks, so NaN fails them as in validate_rice_input
+    codes = np.select(
+        [
+            ~(reach >= 0),
+            ~((impact >= 1) & (impact <= 5)),
+            ~((confidence >= 0) & (confidence <= 100)),
+            ~((effort >= 1) & (effort <= 5))
+        ],
+        [RICE_ERR_REACH, RICE_ERR_IMPACT, RICE_ERR_CONFIDENCE, RICE_ERR_EFFORT],
+        default=RICE_OK
+    )
     
-    return True, ""
+    return codes == 0, codes